@@ -12,26 +12,51 @@ This package provides the core functionality for:
 - Error handling
 """
 
-from .bridge import GeodeBridge
-from .config import Config
-from .exceptions import (
-    GeodeException,
-    ConfigurationError,
-    FileOperationError,
-    ObsidianError,
-    ObsidianConnectionError,
-    ObsidianAuthError,
-    ObsidianAPIError,
-    GeminiError,
-    GeminiAuthError,
-    GeminiAPIError,
-    PluginError
-)
-from .history import ChatHistoryManager, ChatSession, ChatMessage
-from .obsidian_api import ObsidianAPI, ObsidianTools
-from .plugins import PluginManager, PluginProtocol
-from .mcp_client import MCPClient, MCPServerConfig
-from .ai_client import AIClient, create_ai_client
+import importlib
+
+# Public names are resolved from their submodules on first access, so importing
+# a single submodule (e.g. ``geode_bridge.config``) does not pull in the bridge,
+# the HTTP client and every AI provider wrapper at startup.
+_LAZY_EXPORTS = {
+    "GeodeBridge": ".bridge",
+    "Config": ".config",
+    "GeodeException": ".exceptions",
+    "ConfigurationError": ".exceptions",
+    "FileOperationError": ".exceptions",
+    "ObsidianError": ".exceptions",
+    "ObsidianConnectionError": ".exceptions",
+    "ObsidianAuthError": ".exceptions",
+    "ObsidianAPIError": ".exceptions",
+    "GeminiError": ".exceptions",
+    "GeminiAuthError": ".exceptions",
+    "GeminiAPIError": ".exceptions",
+    "PluginError": ".exceptions",
+    "ChatHistoryManager": ".history",
+    "ChatSession": ".history",
+    "ChatMessage": ".history",
+    "ObsidianAPI": ".obsidian_api",
+    "ObsidianTools": ".obsidian_api",
+    "PluginManager": ".plugins",
+    "PluginProtocol": ".plugins",
+    "MCPClient": ".mcp_client",
+    "MCPServerConfig": ".mcp_client",
+    "AIClient": ".ai_client",
+    "create_ai_client": ".ai_client",
+}
+
+
+def __getattr__(name):
+    """Import public names from their submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
 
 __version__ = "1.0.0"
 __author__ = "Geode Development Team"
@@ -2,7 +2,7 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Callable
+from typing import List, Callable
 from .config import Config
 from .exceptions import GeminiAuthError, GeminiAPIError
 
@@ -7,7 +7,7 @@ from .obsidian_api import ObsidianAPI, ObsidianTools
 from .plugins import PluginManager
 from .mcp_client import MCPClient
 from .ai_client import create_ai_client
-from .exceptions import GeminiAuthError, GeminiAPIError, GeodeException
+from .exceptions import GeminiAuthError
 from .exceptions import ObsidianAuthError, ObsidianConnectionError
 
 logger = logging.getLogger(__name__)
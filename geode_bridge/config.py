@@ -3,6 +3,8 @@
 import os
 import json
 import logging
+import copy
+import functools
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import List
@@ -13,6 +15,22 @@ from .exceptions import ConfigurationError, FileOperationError
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _read_config_file(path: str, mtime_ns: int) -> dict:
+    """
+    Read and parse a config file, memoized on its path and modification time.
+    
+    Args:
+        path: Path to the JSON config file
+        mtime_ns: File modification time, used only as part of the cache key
+        
+    Returns:
+        dict: Parsed configuration data (callers must not mutate it)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 @dataclass
 class Config:
     """
@@ -93,11 +111,11 @@ class Config:
         config_file = Path("config.json")
         config_data = {}
         
-        # Load from file if it exists
+        # Load from file if it exists; unchanged files are served from cache
         if config_file.exists():
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
+                mtime_ns = config_file.stat().st_mtime_ns
+                config_data = copy.deepcopy(_read_config_file(str(config_file), mtime_ns))
                 logger.info("Configuration loaded from config.json")
             except (json.JSONDecodeError, IOError) as e:
                 logger.error(f"Failed to load config file: {e}")
@@ -165,6 +183,9 @@ class Config:
                 with open("config.json", 'w', encoding='utf-8') as f:
                     json.dump(data_to_save, f, indent=4, sort_keys=True)
                 
+                # Don't serve the previous contents if the mtime did not tick
+                _read_config_file.cache_clear()
+                
                 logger.info("Configuration saved successfully.")
                 return True
                 
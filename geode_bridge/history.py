@@ -9,18 +9,20 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import time  # <--- THE MISSING IMPORT IS ADDED HERE
 
-from PyQt6.QtCore import QMutex, QMutexLocker
-from .exceptions import FileOperationError
+from PyQt6.QtCore import QMutex, QMutexLocker, QTimer, QRunnable, QThreadPool
 
 logger = logging.getLogger(__name__)
 
 # --- ChatMessage and ChatSession dataclasses (Unchanged) ---
 @dataclass
 class ChatMessage:
-    timestamp: str; sender: str; content: str; message_type: str = "text"
+    # One instance per stored message across every session, so skip the per-instance __dict__.
+    # A slotted dataclass field cannot have a class-level default; from_dict supplies it instead.
+    __slots__ = ('timestamp', 'sender', 'content', 'message_type')
+    timestamp: str; sender: str; content: str; message_type: str
     def to_dict(self) -> Dict[str, Any]: return asdict(self)
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'ChatMessage': return cls(**data)
+    def from_dict(cls, data: Dict[str, Any]) -> 'ChatMessage': return cls(**{'message_type': "text", **data})
 
 @dataclass
 class ChatSession:
@@ -32,13 +34,34 @@ class ChatSession:
         messages = [ChatMessage.from_dict(msg) for msg in data.get('messages', [])]
         return cls(session_id=data['session_id'], title=data['title'], created_at=data['created_at'], updated_at=data['updated_at'], messages=messages)
 
+class _HistoryWriteTask(QRunnable):
+    """Writes a chat history snapshot to disk on a pool thread."""
+    def __init__(self, manager: 'ChatHistoryManager', snapshot: List[tuple], sequence: int):
+        super().__init__()
+        self.manager = manager; self.snapshot = snapshot; self.sequence = sequence
+
+    def run(self):
+        self.manager._write_snapshot(self.snapshot, self.sequence)
+
 class ChatHistoryManager:
     """Manages the lifecycle of all chat sessions, including saving and loading."""
+    # Messages arriving within this window are written to disk in a single save.
+    FLUSH_INTERVAL_MS = 200
+
     def __init__(self, history_file: str, max_sessions: int = 50):
         self.history_file = Path(history_file)
         self.max_sessions = max_sessions
         self.sessions: Dict[str, ChatSession] = {}
+        # Sessions ordered newest first; rebuilt lazily after any mutation
+        self._recent_index: Optional[List[ChatSession]] = None
         self._file_mutex = QMutex()
+        self._dirty = False
+        self._snapshot_seq = 0
+        self._written_seq = 0
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
         self.load_history()
 
     def create_session(self, title: str = None) -> ChatSession:
@@ -46,28 +69,50 @@ class ChatHistoryManager:
         timestamp = datetime.now().isoformat()
         if not title: title = f"Chat - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
         session = ChatSession(session_id=session_id, title=title, created_at=timestamp, updated_at=timestamp, messages=[])
-        self.sessions[session_id] = session
+        self.sessions[session_id] = session; self._recent_index = None
         self.save_history(); logger.info(f"Created new chat session: {title} ({session_id})"); return session
 
     def add_message(self, session_id: str, sender: str, content: str, message_type: str = "text"):
         session = self.get_session(session_id)
         if not session: logger.warning(f"Attempted to add message to non-existent session: {session_id}"); return
         message = ChatMessage(timestamp=datetime.now().isoformat(), sender=sender, content=content, message_type=message_type)
-        session.messages.append(message); session.updated_at = datetime.now().isoformat(); self.save_history()
+        session.messages.append(message); session.updated_at = datetime.now().isoformat(); self._recent_index = None
+        self._dirty = True; self._flush_timer.start()
+
+    def flush(self, blocking: bool = False):
+        """
+        Write any messages added since the last save to disk.
+
+        The snapshot is taken on the calling thread; unless ``blocking`` is set,
+        the JSON encoding and file write run on the global QThreadPool.
+        """
+        self._flush_timer.stop()
+        if not self._dirty: return
+        snapshot, sequence = self._take_snapshot()
+        if blocking: self._write_snapshot(snapshot, sequence)
+        else: QThreadPool.globalInstance().start(_HistoryWriteTask(self, snapshot, sequence))
 
     def get_session(self, session_id: str) -> Optional[ChatSession]:
         return self.sessions.get(session_id)
 
-    def get_recent_sessions(self, limit: int = 20) -> List[ChatSession]:
-        return sorted(self.sessions.values(), key=lambda s: s.updated_at, reverse=True)[:limit]
+    def get_recent_sessions(self, limit: Optional[int] = 20) -> List[ChatSession]:
+        """Return up to ``limit`` sessions newest first, or all of them when ``limit`` is None."""
+        return self._sessions_by_recency()[:limit]
+
+    def _sessions_by_recency(self) -> List[ChatSession]:
+        """Return all sessions newest first, sorting only when the sessions have changed."""
+        if self._recent_index is None:
+            self._recent_index = sorted(self.sessions.values(), key=lambda s: s.updated_at, reverse=True)
+        return self._recent_index
 
     def delete_session(self, session_id: str) -> bool:
         if session_id in self.sessions:
-            del self.sessions[session_id]; self.save_history(); logger.info(f"Deleted session: {session_id}"); return True
+            del self.sessions[session_id]; self._recent_index = None; self.save_history(); logger.info(f"Deleted session: {session_id}"); return True
         logger.warning(f"Attempted to delete non-existent session: {session_id}"); return False
 
     def load_history(self):
         """Thread-safe loading of all chat sessions from the JSON file."""
+        self._recent_index = None
         with QMutexLocker(self._file_mutex):
             if not self.history_file.exists():
                 logger.info("Chat history file not found. A new one will be created on the first save.")
@@ -102,18 +147,43 @@ class ChatHistoryManager:
 
     def save_history(self):
         """Thread-safe and atomic saving of all chat sessions to the JSON file."""
+        snapshot, sequence = self._take_snapshot()
+        self._write_snapshot(snapshot, sequence)
+
+    def _take_snapshot(self) -> tuple[List[tuple], int]:
+        """
+        Prune old sessions and capture the current state.
+
+        Only references are copied here so the caller's thread does little work;
+        messages are never mutated once added, so they can be encoded later on
+        another thread.
+        """
+        if len(self.sessions) > self.max_sessions:
+            kept = self._sessions_by_recency()[:self.max_sessions]
+            self.sessions = {s.session_id: s for s in kept}; self._recent_index = kept
+        self._dirty = False; self._snapshot_seq += 1
+        snapshot = [(s.session_id, s.title, s.created_at, s.updated_at, tuple(s.messages)) for s in self.sessions.values()]
+        return snapshot, self._snapshot_seq
+
+    @staticmethod
+    def _encode_snapshot(snapshot: List[tuple]) -> Dict[str, Any]:
+        """Convert a snapshot from _take_snapshot into the on-disk JSON structure."""
+        return {'sessions': [
+            {'session_id': session_id, 'title': title, 'created_at': created_at, 'updated_at': updated_at, 'messages': [msg.to_dict() for msg in messages]}
+            for session_id, title, created_at, updated_at, messages in snapshot
+        ]}
+
+    def _write_snapshot(self, snapshot: List[tuple], sequence: int):
+        """Atomically write a snapshot unless a newer one has already been written."""
         with QMutexLocker(self._file_mutex):
+            if sequence <= self._written_seq: return
             try:
-                if len(self.sessions) > self.max_sessions:
-                    sorted_sessions = sorted(self.sessions.values(), key=lambda s: s.updated_at, reverse=True)
-                    self.sessions = {s.session_id: s for s in sorted_sessions[:self.max_sessions]}
-                
-                data = {'sessions': [session.to_dict() for session in self.sessions.values()]}
-                
+                data = self._encode_snapshot(snapshot)
                 temp_file = self.history_file.with_suffix(".tmp")
                 with open(temp_file, 'w', encoding='utf-8') as f:
                     json.dump(data, f, indent=2)
                 
-                temp_file.rename(self.history_file)
+                temp_file.replace(self.history_file)
+                self._written_seq = sequence
             except Exception as e:
-                logger.error(f"Failed to save chat history: {e}", exc_info=True)
\ No newline at end of file
+                logger.error(f"Failed to save chat history: {e}", exc_info=True)
@@ -1,9 +1,8 @@
 # geode_bridge/mcp_client.py
 
-import asyncio
 import json
 import logging
-from typing import List, Dict, Optional, Any, Callable
+from typing import List, Dict, Any, Callable
 from dataclasses import dataclass
 from pathlib import Path
 
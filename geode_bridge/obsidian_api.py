@@ -3,7 +3,8 @@
 import requests
 import urllib.parse
 import logging
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 
 from .config import Config
 from .exceptions import (
@@ -130,6 +131,10 @@ class ObsidianTools:
     with proper error handling and user-friendly response messages.
     """
     
+    # Concurrent directory listings during a full vault scan; stays below
+    # the requests connection pool size so every worker keeps a connection
+    SCAN_WORKERS = 8
+    
     def __init__(self, api: ObsidianAPI):
         """
         Initialize the tools with an API client.
@@ -177,19 +182,22 @@ class ObsidianTools:
         """
         List all files and folders recursively from the vault root.
         
+        Each level of the folder tree is fetched concurrently on a small
+        thread pool, so a scan takes one round trip per level of depth
+        rather than one per folder.
+        
         Returns:
             str: Success message with complete file list or error message
         """
         all_paths = []
         
-        def fetch_directory(path: str) -> None:
-            """Recursively fetch directory contents."""
+        def parse_directory(path: str, response_str: str) -> List[str]:
+            """Record a directory's contents and return its subdirectories."""
+            subdirectories = []
             try:
-                response_str = self.list_files(path)
-                
                 if response_str.startswith("ERROR"):
                     logger.warning(f"Could not fully scan vault. Error at '{path}': {response_str}")
-                    return
+                    return subdirectories
                 
                 # Process the response from list_files
                 lines = response_str.replace("SUCCESS:\\n", "").strip().split('\\n')
@@ -205,15 +213,22 @@ class ObsidianTools:
                     
                     all_paths.append(full_path)
                     
-                    # If it's a directory, recurse into it
+                    # If it's a directory, scan it with the next level
                     if item.endswith('/'):
-                        fetch_directory(full_path)
+                        subdirectories.append(full_path)
                         
             except Exception as e:
                 logger.error(f"Failed during recursive file listing at '{path}': {e}", exc_info=True)
+            return subdirectories
 
-        # Start the recursive listing from the root
-        fetch_directory(".")
+        # Walk the tree breadth-first from the root
+        with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as pool:
+            level = ["."]
+            while level:
+                next_level = []
+                for path, response_str in zip(level, pool.map(self.list_files, level)):
+                    next_level.extend(parse_directory(path, response_str))
+                level = next_level
         
         if not all_paths:
             return "ERROR: No files or folders found in the vault, or the vault root could not be read."
@@ -1,38 +1,47 @@
 
 # geode_gui.py
 
+import functools
+import itertools
+import math
+import os
 import sys
 import json
+import queue
+import string
 import logging
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Set, TYPE_CHECKING
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSplitter, 
-    QFrame, QLabel, QPushButton, QListWidget, QListWidgetItem, QScrollArea,
+    QFrame, QLabel, QPushButton, QScrollArea,
     QTextEdit, QDialog, QLineEdit, QFormLayout, QDialogButtonBox, QMessageBox,
-    QMenu, QTabWidget, QGroupBox, QCheckBox, QComboBox
+    QMenu, QTabWidget, QGroupBox, QCheckBox, QComboBox, QListView
 )
-from PyQt6.QtCore import Qt, QObject, QRunnable, pyqtSignal, pyqtSlot, QThreadPool
-from PyQt6.QtGui import QKeyEvent
+from PyQt6.QtCore import (
+    Qt, QEvent, QObject, QRunnable, QThread, pyqtSignal, pyqtSlot, QThreadPool, QTimer,
+    QAbstractListModel, QModelIndex, QPoint, QStringListModel
+)
+from PyQt6.QtGui import QKeyEvent, QIcon, QPainter, QPixmap, QStaticText, QTransform
 
 # --- Import from our backend package ---
 from geode_bridge.config import Config
-from geode_bridge.exceptions import *
 from geode_bridge.history import ChatHistoryManager
-from geode_bridge.bridge import GeodeBridge
 
-# --- Material Design Theme ---
-try:
-    from qt_material import apply_stylesheet
-    QT_MATERIAL_AVAILABLE = True
-except ImportError:
-    QT_MATERIAL_AVAILABLE = False
+if TYPE_CHECKING:
+    # Imported lazily in refresh_bridge; it pulls in the HTTP and AI clients
+    from geode_bridge.bridge import GeodeBridge
 
 # --- SETUP ---
-# Logging is configured in the backend, but we can get the logger here.
+# Logging is configured in __main__; importing the module never touches it
 logger = logging.getLogger(__name__)
 
+# Config attributes holding AI provider keys (Ollama runs locally without one)
+_API_KEY_ATTRS = (
+    "gemini_api_key", "claude_api_key", "openai_api_key", "cohere_api_key",
+    "mistral_api_key", "perplexity_api_key", "together_api_key"
+)
+
 # --- THREADING & GUI WIDGETS ---
 
 class WorkerSignals(QObject):
@@ -46,7 +55,7 @@ class WorkerSignals(QObject):
 class GeminiWorker(QRunnable):
     """Worker thread for handling AI message processing."""
     
-    def __init__(self, bridge: GeodeBridge, prompt: str):
+    def __init__(self, bridge: 'GeodeBridge', prompt: str):
         super().__init__()
         self.bridge = bridge
         self.prompt = prompt
@@ -58,30 +67,65 @@ class GeminiWorker(QRunnable):
         self.bridge.send_message(self.prompt, self.signals)
 
 
-class FileCacheWorker(QRunnable):
-    """Worker thread for updating the file cache from Obsidian vault."""
+# Cache workers still scanning when their window closed. They have no parent,
+# so nothing destroys them mid-scan; each drops out here once its run() returns.
+_abandoned_cache_workers: Set["FileCacheWorker"] = set()
+
+
+class FileCacheWorker(QThread):
+    """Persistent worker thread that refreshes the file cache from the Obsidian vault."""
     
-    def __init__(self, bridge: GeodeBridge):
-        super().__init__()
-        self.bridge = bridge
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.signals = WorkerSignals()
+        # Holds at most one pending refresh; the bridge to scan with
+        self._requests: "queue.Queue[Optional[GeodeBridge]]" = queue.Queue(maxsize=1)
+        self._stopping = False
+    
+    def request_refresh(self, bridge: 'GeodeBridge'):
+        """
+        Queue a vault scan, replacing any request that has not started yet.
+        
+        Args:
+            bridge: The bridge whose tools are used for the scan
+        """
+        try:
+            self._requests.get_nowait()
+        except queue.Empty:
+            pass
+        self._requests.put_nowait(bridge)
+    
+    def stop(self):
+        """Ask the thread to exit once the current scan, if any, completes."""
+        self._stopping = True
+        try:
+            self._requests.put_nowait(None)
+        except queue.Full:
+            pass
     
-    @pyqtSlot()
     def run(self):
+        """Serve refresh requests until stopped."""
+        while True:
+            bridge = self._requests.get()
+            if bridge is None or self._stopping:
+                break
+            self._refresh(bridge)
+    
+    def _refresh(self, bridge: 'GeodeBridge'):
         """Fetch and update the file cache."""
-        logger.info("Caching vault file tree...")
+        logger.debug("Caching vault file tree...")
         try:
-            items_str = self.bridge.tools.list_all_files()
+            items_str = bridge.tools.list_all_files()
             if not items_str.startswith("ERROR"):
                 all_files = items_str.replace("SUCCESS:\\n", "").strip().split('\\n')
                 unique_files = sorted(list(set(all_files)))
                 self.signals.file_cache_updated.emit(unique_files)
-                logger.info(f"File cache updated. Found {len(unique_files)} items.")
+                logger.debug("File cache updated. Found %d items.", len(unique_files))
             else:
-                logger.error(f"Error updating file cache: {items_str}")
+                logger.error("Error updating file cache: %s", items_str)
                 self.signals.error.emit(items_str)
         except Exception as e:
-            logger.error(f"Critical error during file cache update: {e}", exc_info=True)
+            logger.error("Critical error during file cache update: %s", e, exc_info=True)
             self.signals.error.emit(str(e))
         finally:
             self.signals.finished.emit()
@@ -91,31 +135,53 @@ class FileCacheWorker(QRunnable):
 # UI COMPONENTS - AUTOCOMPLETE
 # ============================================================================
 
-class AutocompletePopup(QListWidget):
+class AutocompletePopup(QListView):
     """Popup widget for file path autocomplete functionality."""
     
+    # Most suggestions shown at once
+    MAX_SUGGESTIONS = 10
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.WindowType.Popup | Qt.WindowType.FramelessWindowHint)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.setUniformItemSizes(True)
+        self._suggestion_model = QStringListModel(self)
+        self.setModel(self._suggestion_model)
         self._setup_styling()
     
     def _setup_styling(self):
         """Configure the visual appearance of the popup."""
         self.setStyleSheet("""
-            QListWidget {
+            QListView {
                 border: 1px solid #475569;
                 background-color: #334155;
                 font-size: 13px;
                 border-radius: 6px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 8px;
                 border-radius: 4px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #2563eb;
             }
         """)
+    
+    def set_suggestions(self, suggestions: List[str]):
+        """Replace the listed suggestions and select the first one."""
+        self._suggestion_model.setStringList(suggestions)
+        if suggestions:
+            self.setCurrentIndex(self._suggestion_model.index(0))
+    
+    def count(self) -> int:
+        """Number of suggestions currently listed."""
+        return self._suggestion_model.rowCount()
+    
+    def current_text(self) -> Optional[str]:
+        """Text of the selected suggestion, or None if nothing is selected."""
+        index = self.currentIndex()
+        return index.data() if index.isValid() else None
 
 
 class ChatInput(QTextEdit):
@@ -126,18 +192,38 @@ class ChatInput(QTextEdit):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.file_cache = []
+        self._file_cache_index = []
+        self._pending_file_cache = None
         self.autocomplete_popup = AutocompletePopup(self)
         self._setup_connections()
     
     def _setup_connections(self):
         """Set up signal connections."""
-        self.autocomplete_popup.itemClicked.connect(self.complete_text)
+        self.autocomplete_popup.clicked.connect(self._on_suggestion_clicked)
         self.textChanged.connect(self.handle_autocomplete)
     
+    @pyqtSlot(QModelIndex)
+    def _on_suggestion_clicked(self, index):
+        """Complete the input with the clicked suggestion."""
+        self.complete_text(index.data())
+    
     @pyqtSlot(list)
     def update_file_cache(self, new_cache):
-        """Update the available files for autocomplete."""
-        self.file_cache = new_cache
+        """
+        Update the available files for autocomplete.
+        
+        The search index is only built once the user opens the file picker,
+        so views that never use autocomplete never pay for it.
+        """
+        self._pending_file_cache = new_cache
+    
+    def _install_pending_file_cache(self):
+        """Build the autocomplete search index from the pending file cache."""
+        if self._pending_file_cache is None:
+            return
+        self.file_cache = self._pending_file_cache
+        self._file_cache_index = [(path.lower(), path) for path in self.file_cache]
+        self._pending_file_cache = None
     
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard events for autocomplete and message sending."""
@@ -150,8 +236,9 @@ class ChatInput(QTextEdit):
         
         # Handle autocomplete selection
         if is_popup_visible and event.key() in (Qt.Key.Key_Enter, Qt.Key.Key_Return, Qt.Key.Key_Tab):
-            if self.autocomplete_popup.currentItem():
-                self.complete_text(self.autocomplete_popup.currentItem())
+            current_text = self.autocomplete_popup.current_text()
+            if current_text:
+                self.complete_text(current_text)
             self.autocomplete_popup.hide()
             return
         
@@ -162,9 +249,12 @@ class ChatInput(QTextEdit):
         
         super().keyPressEvent(event)
     
+    @pyqtSlot()
     def handle_autocomplete(self):
         """Process text changes and show autocomplete suggestions."""
-        text_before_cursor = self.toPlainText()[:self.textCursor().position()]
+        # A file reference never spans lines, so only the cursor's line is read
+        # instead of copying the whole document on every keystroke
+        text_before_cursor = self._line_before_cursor()
         trigger = "/"
         last_trigger_pos = text_before_cursor.rfind(trigger)
         
@@ -174,26 +264,36 @@ class ChatInput(QTextEdit):
         
         search_text = text_before_cursor[last_trigger_pos + len(trigger):]
         
-        # Hide popup if search text contains spaces or newlines
-        if " " in search_text or "\\n" in search_text:
+        # Hide popup if search text contains spaces
+        if " " in search_text:
             self.autocomplete_popup.hide()
             return
         
-        # Filter suggestions based on search text
+        self._install_pending_file_cache()
+        
+        # Filter suggestions based on search text, stopping once the popup is full
+        limit = AutocompletePopup.MAX_SUGGESTIONS
         if search_text:
-            suggestions = [path for path in self.file_cache if search_text.lower() in path.lower()]
+            needle = search_text.lower()
+            suggestions = list(itertools.islice(
+                (path for lowered, path in self._file_cache_index if needle in lowered), limit
+            ))
         else:
-            suggestions = self.file_cache
+            suggestions = self.file_cache[:limit]
         
         if suggestions:
             self.update_popup_suggestions(suggestions)
         else:
             self.autocomplete_popup.hide()
     
+    def _line_before_cursor(self) -> str:
+        """Text of the cursor's line up to the cursor."""
+        cursor = self.textCursor()
+        return cursor.block().text()[:cursor.positionInBlock()]
+    
     def update_popup_suggestions(self, suggestions):
         """Update and show the autocomplete popup with suggestions."""
-        self.autocomplete_popup.clear()
-        self.autocomplete_popup.addItems(suggestions[:10])  # Limit to 10 items
+        self.autocomplete_popup.set_suggestions(suggestions[:AutocompletePopup.MAX_SUGGESTIONS])
         
         if self.autocomplete_popup.count() > 0:
             # Position popup below cursor
@@ -203,15 +303,13 @@ class ChatInput(QTextEdit):
             self.autocomplete_popup.setMinimumWidth(self.width() - 20)
             self.autocomplete_popup.adjustSize()
             self.autocomplete_popup.show()
-            self.autocomplete_popup.setCurrentRow(0)
         else:
             self.autocomplete_popup.hide()
     
-    def complete_text(self, item):
-        """Complete the text with the selected item."""
-        completion_text = item.text()
+    def complete_text(self, completion_text):
+        """Complete the text with the selected file path."""
         cursor = self.textCursor()
-        text_before_cursor = self.toPlainText()[:cursor.position()]
+        text_before_cursor = self._line_before_cursor()
         
         trigger = "/"
         last_trigger_pos = text_before_cursor.rfind(trigger)
@@ -496,6 +594,34 @@ class SettingsDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
     
+    def reload_from(self, config: Config):
+        """
+        Re-populate the form from a configuration without rebuilding widgets.
+        
+        Args:
+            config: The configuration to display and save into
+        """
+        self.config = config
+        self.setWindowTitle("Geode Settings")
+        
+        # Mirror _setup_ui, which selects the provider before connecting its signal
+        self.ai_provider_combo.blockSignals(True)
+        self.ai_provider_combo.setCurrentText(self.config.ai_provider)
+        self.ai_provider_combo.blockSignals(False)
+        self.current_api_key_edit.clear()
+        
+        self.obsidian_key_edit.setText(self.config.obsidian_api_key)
+        self.port_edit.setText(str(self.config.obsidian_port))
+        
+        self._update_available_models()
+        self.model_combo.setCurrentText(self.config.model_name)
+        
+        self.mcp_enabled_checkbox.setChecked(self.config.enable_mcp)
+        self.mcp_config_edit.setText(self.config.mcp_config_file)
+        # Drop any status a cancelled session left for another provider
+        self.mcp_status_label.setText("Status: Not connected")
+        self.mcp_status_label.setStyleSheet("color: #666; font-size: 11px;")
+
     def open_url(self, url: str):
         """Open URL in default browser"""
         from PyQt6.QtGui import QDesktopServices
@@ -580,6 +706,7 @@ class SettingsDialog(QDialog):
             "ollama": ("Base URL:", self.ollama_url_edit),
         }
     
+    @pyqtSlot(str)
     def _on_provider_changed(self, provider: str):
         """Handle AI provider selection change."""
         # Just update available models - all API key fields are always visible
@@ -657,74 +784,253 @@ class SettingsDialog(QDialog):
 # MESSAGE CARDS
 # ============================================================================
 
+def build_theme_qss(theme: Dict[str, str]) -> Dict[str, str]:
+    """
+    Build the chat view, message card and sidebar stylesheets for a theme.
+    
+    The fragments are formatted once and shared by every chat view and
+    card so that creating one never re-formats stylesheet strings.
+    
+    Args:
+        theme: Theme colour mapping used by the application
+        
+    Returns:
+        Dict[str, str]: Stylesheet fragments keyed by widget element
+    """
+    return {
+        # Set once on the message container; cards only carry object names.
+        # Label colours and fonts stay here rather than in QPalette/QFont: the
+        # qt-material base sheet sets color and font-size on every widget, and
+        # a style sheet rule always wins over a programmatic palette or font.
+        "message_area": f"""
+            QFrame#aiCard {{
+                background-color: {theme['surface']};
+                border-radius: 12px;
+            }}
+            QFrame#errorCard {{
+                border: 1px solid red;
+                background-color: #401010;
+                border-radius: 12px;
+            }}
+            QFrame#userCard {{
+                border: none;
+            }}
+            QLabel#geodeSender, QLabel#toolSender, QLabel#userSender {{
+                font-size: 13px;
+                font-weight: bold;
+                background-color: transparent;
+            }}
+            QLabel#geodeSender {{
+                color: {theme['secondary_accent']};
+            }}
+            QLabel#toolSender {{
+                color: {theme['tertiary_accent']};
+            }}
+            QLabel#userSender {{
+                color: {theme['primary_accent']};
+            }}
+            QLabel#chatMessage {{
+                color: {theme['text_primary']};
+                font-size: 14px;
+                background-color: transparent;
+            }}
+        """,
+        # Set once on the composer frame, selecting its children by object name
+        "composer": f"""
+            QFrame#composer {{
+                background-color: {theme['background']};
+            }}
+            QTextEdit#composerInput {{
+                background-color: {theme['surface']};
+                color: {theme['text_primary']};
+                border: 1px solid #475569;
+                border-radius: 12px;
+                font-size: 14px;
+                padding: 10px;
+            }}
+            QPushButton#sendButton {{
+                background-color: {theme['primary_accent']};
+                color: white;
+                border: none;
+                border-radius: 12px;
+                font-size: 14px;
+                font-weight: bold;
+            }}
+            QPushButton#sendButton:hover {{
+                background-color: #3b82f6;
+            }}
+        """,
+        # Set once on the sidebar root. The object-name selectors outrank the
+        # pane-wide QPushButton/QListView overrides layered on the same widget.
+        "sidebar": f"""
+            QPushButton#newChatButton {{
+                background-color: {theme['tertiary_accent']};
+                color: #ffffff;
+                border: none;
+                border-radius: 10px;
+                text-align: left;
+                padding-left: 14px;
+                font-size: 14px;
+                font-weight: bold;
+            }}
+            QLabel#recentsLabel {{
+                color: {theme['text_secondary']};
+                font-size: 11px;
+                font-weight: bold;
+                border: none;
+            }}
+            QListView#chatList {{
+                border: none;
+                font-size: 13px;
+            }}
+            QListView#chatList::item {{
+                height: 36px;
+                padding-left: 10px;
+                border-radius: 6px;
+                margin: 2px 0px;
+            }}
+            QListView#chatList::item:hover {{
+                background-color: #475569;
+            }}
+            QListView#chatList::item:selected {{
+                background-color: {theme['background']};
+                color: {theme['text_primary']};
+            }}
+            QPushButton#settingsButton {{
+                background-color: transparent;
+                border: none;
+                padding: 0px;
+            }}
+        """,
+    }
+
+
+class WrappedTextLabel(QLabel):
+    """
+    Word-wrapped label whose text is laid out once per width.
+    
+    A plain word-wrapped QLabel re-flows its text on every resize of the
+    scroll area and again on every paint. This label lays its text out into a
+    QStaticText, pins the height to it and paints that cached layout, only
+    re-measuring when the width changes materially, growing or shrinking.
+    """
+    
+    RELAYOUT_THRESHOLD = 10
+    
+    def __init__(self, text, parent=None):
+        super().__init__(text, parent)
+        self.setObjectName("chatMessage")
+        # Messages are plain text, which is also what _update_height measures;
+        # this skips the rich-text sniffing QLabel does on every setText
+        self.setTextFormat(Qt.TextFormat.PlainText)
+        # Message text is display-only; let mouse events stop at the card
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        self.setWordWrap(True)
+        self._static_text = QStaticText()
+        self._static_text.setTextFormat(Qt.TextFormat.PlainText)
+        self._measured_width = -1
+    
+    def setText(self, text):
+        """Set the label text and force a re-measure."""
+        super().setText(text)
+        self._measured_width = -1
+        self._update_height(self.width())
+    
+    def resizeEvent(self, event):
+        """Re-measure on any shrink, and on growth beyond the threshold."""
+        super().resizeEvent(event)
+        width = event.size().width()
+        # A layout wider than the label would paint past its right edge
+        if width < self._measured_width or width - self._measured_width > self.RELAYOUT_THRESHOLD:
+            self._update_height(width)
+    
+    def changeEvent(self, event):
+        """Re-measure when the stylesheet gives the label a different font."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._measured_width = -1
+            self._update_height(self.width())
+    
+    def paintEvent(self, event):
+        """Draw the cached text layout instead of re-flowing the text."""
+        if self._measured_width < 0:
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawStaticText(self.contentsRect().topLeft(), self._static_text)
+    
+    def _update_height(self, width: int):
+        """Lay the text out at the given width and pin the label height to it."""
+        if width <= 0:
+            return
+        self._measured_width = width
+        margins = self.contentsMargins()
+        # QStaticText treats '\n' as a space; explicit line breaks must be separators
+        self._static_text.setText(self.text().replace("\n", "\u2028"))
+        self._static_text.setTextWidth(max(1, width - margins.left() - margins.right()))
+        self._static_text.prepare(QTransform(), self.font())
+        text_height = math.ceil(self._static_text.size().height())
+        self.setFixedHeight(text_height + margins.top() + margins.bottom())
+
+
 class GroupedMessageCard(QFrame):
     """Card widget for displaying AI responses and tool calls."""
     
-    def __init__(self, theme, model_name):
+    def __init__(self, model_name, object_name="aiCard"):
         super().__init__()
-        self.theme = theme
+        self.setObjectName(object_name)
         self.model_name = model_name
         self._setup_ui()
     
     def _setup_ui(self):
         """Set up the message card UI."""
         self.setContentsMargins(0, 0, 0, 0)
-        self.setStyleSheet(f"QFrame {{ background-color: {self.theme['surface']}; border-radius: 12px; }}")
+        # The stylesheet paints the card; skip QFrame's own frame drawing
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         
+        # Sender and content labels sit directly in the card; no frame per part
         self.card_layout = QVBoxLayout(self)
         self.card_layout.setContentsMargins(12, 12, 12, 12)
-        self.card_layout.setSpacing(10)
+        self.card_layout.setSpacing(5)
     
     def add_message_part(self, sender, text, is_tool_call=False):
         """Add a message part to this card."""
         if is_tool_call:
             sender_text = "⚙️ System (Executing Tool)"
-            sender_color = self.theme['tertiary_accent']
+            sender_name = "toolSender"
         else:
             sender_text = f"Geode ({self.model_name})"
-            sender_color = self.theme['secondary_accent']
-        
-        # Create the message part
-        part_frame = QFrame()
-        part_layout = QVBoxLayout(part_frame)
-        part_layout.setContentsMargins(0, 0, 0, 0)
-        part_layout.setSpacing(5)
+            sender_name = "geodeSender"
         
-        # Sender label
+        # Sender label, separated from any previous part
         sender_label = QLabel(sender_text)
-        sender_label.setStyleSheet(f"""
-            color: {sender_color};
-            font-size: 13px;
-            font-weight: bold;
-            background-color: transparent;
-        """)
-        part_layout.addWidget(sender_label)
+        sender_label.setObjectName(sender_name)
+        sender_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        if self.card_layout.count():
+            sender_label.setContentsMargins(0, 5, 0, 0)
+        self.card_layout.addWidget(sender_label)
         
         # Content label
-        content_label = QLabel(text)
-        content_label.setWordWrap(True)
-        content_label.setStyleSheet(f"""
-            color: {self.theme['text_primary']};
-            font-size: 14px;
-            background-color: transparent;
-        """)
-        part_layout.addWidget(content_label)
-        
-        self.card_layout.addWidget(part_frame)
+        content_label = WrappedTextLabel(text)
+        self.card_layout.addWidget(content_label)
 
 
 class UserMessageCard(QFrame):
     """Card widget for displaying user messages."""
     
-    def __init__(self, text, theme):
+    def __init__(self, text):
         super().__init__()
-        self.theme = theme
         self._setup_ui(text)
     
     def _setup_ui(self, text):
         """Set up the user message card UI."""
+        self.setObjectName("userCard")
         self.setContentsMargins(0, 0, 0, 0)
-        self.setStyleSheet("border: none;")
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         
         card_layout = QVBoxLayout(self)
         card_layout.setContentsMargins(12, 12, 12, 12)
@@ -732,20 +1038,12 @@ class UserMessageCard(QFrame):
         
         # Sender label
         sender_label = QLabel("You")
-        sender_label.setStyleSheet(f"""
-            color: {self.theme['primary_accent']};
-            font-size: 13px;
-            font-weight: bold;
-        """)
+        sender_label.setObjectName("userSender")
+        sender_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         card_layout.addWidget(sender_label)
         
         # Content label
-        content_label = QLabel(text)
-        content_label.setWordWrap(True)
-        content_label.setStyleSheet(f"""
-            color: {self.theme['text_primary']};
-            font-size: 14px;
-        """)
+        content_label = WrappedTextLabel(text)
         card_layout.addWidget(content_label)
 
 
@@ -756,14 +1054,26 @@ class UserMessageCard(QFrame):
 class ChatView(QWidget):
     """Main chat interface widget."""
     
-    def __init__(self, theme, bridge, history_manager, file_cache, session_id):
+    # Only the most recent messages get cards; older ones load on request
+    HISTORY_PAGE_SIZE = 50
+    
+    def __init__(self, theme, bridge, history_manager, file_cache, session_id, qss=None):
         super().__init__()
         self.theme = theme
+        self.qss = qss if qss is not None else build_theme_qss(theme)
         self.bridge = bridge
         self.history_manager = history_manager
         self.session_id = session_id
+        # The bridge keeps one conversation, so requests run one at a time on one thread
         self.threadpool = QThreadPool()
+        self.threadpool.setMaxThreadCount(1)
         self.current_ai_card = None
+        self._active_signals = None
+        self._history_start = 0
+        # (history start before the page, card count) for each earlier page shown
+        self._earlier_pages = []
+        self._scroll_anchor = None
+        self._stick_to_bottom = True
         
         self._setup_ui()
         self.text_input.update_file_cache(file_cache)
@@ -790,21 +1100,41 @@ class ChatView(QWidget):
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setStyleSheet("border: none;")
+        # Scrolling is wheel/scroll-bar driven; don't route touch events through the cards
+        self.scroll_area.viewport().setAttribute(Qt.WidgetAttribute.WA_AcceptTouchEvents, False)
         
         self.message_container = QWidget()
+        # One stylesheet for every card, parsed once per view rather than per message
+        self.message_container.setStyleSheet(self.qss["message_area"])
         self.message_layout = QVBoxLayout(self.message_container)
-        self.message_layout.addStretch()
+        # Layout is [earlier-history button, cards...]; it is top-aligned
+        # rather than padded by a trailing stretch, so cards are just appended
+        self.earlier_button = QPushButton("Show earlier messages")
+        self.earlier_button.clicked.connect(self.load_earlier_history)
+        self.earlier_button.hide()
+        self.message_layout.addWidget(self.earlier_button)
+        self._card_widgets = []
+        # Cards created in one event loop pass are laid out together
+        self._pending_cards = []
+        self.message_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.message_layout.setSpacing(15)
         self.message_layout.setContentsMargins(40, 20, 40, 20)
         
         self.scroll_area.setWidget(self.message_container)
         self.main_layout.addWidget(self.scroll_area)
+        
+        # Scrolling follows layout: new content keeps the view pinned to the
+        # bottom, and earlier history is realized once the user scrolls up to it
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.rangeChanged.connect(self._on_scroll_range_changed)
+        scroll_bar.actionTriggered.connect(self._on_scroll_action)
     
     def _setup_input_composer(self):
         """Set up the message input area."""
         composer_frame = QFrame()
+        composer_frame.setObjectName("composer")
         composer_frame.setFixedHeight(80)
-        composer_frame.setStyleSheet(f"background-color: {self.theme['background']};")
+        composer_frame.setStyleSheet(self.qss["composer"])
         
         composer_layout = QHBoxLayout(composer_frame)
         composer_layout.setContentsMargins(40, 10, 40, 10)
@@ -812,35 +1142,14 @@ class ChatView(QWidget):
         # Text input
         self.text_input = ChatInput()
         self.text_input.setPlaceholderText("Reply to Geode... (Press '/' for files, Cmd+Return to send)")
+        self.text_input.setObjectName("composerInput")
         self.text_input.setFixedHeight(44)
-        self.text_input.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {self.theme['surface']};
-                color: {self.theme['text_primary']};
-                border: 1px solid #475569;
-                border-radius: 12px;
-                font-size: 14px;
-                padding: 10px;
-            }}
-        """)
         composer_layout.addWidget(self.text_input)
         
         # Send button
         self.send_button = QPushButton("Send")
+        self.send_button.setObjectName("sendButton")
         self.send_button.setFixedSize(80, 44)
-        self.send_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme['primary_accent']};
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #3b82f6;
-            }}
-        """)
         composer_layout.addWidget(self.send_button)
         
         self.main_layout.addWidget(composer_frame)
@@ -854,29 +1163,123 @@ class ChatView(QWidget):
             self.welcome_message()
             return
         
+        self._history_start = self._page_start(session.messages, len(session.messages))
+        for card in self._build_history_cards(session.messages[self._history_start:]):
+            self._add_widget_to_display(card)
+        self.earlier_button.setVisible(self._history_start > 0)
+    
+    @pyqtSlot()
+    def load_earlier_history(self):
+        """Prepend the page of history just before the oldest displayed message."""
+        session = self.history_manager.get_session(self.session_id)
+        if not session or self._history_start <= 0:
+            self.earlier_button.hide()
+            return
+        
+        # Keep the distance from the bottom so the visible messages stay put
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        self._scroll_anchor = scroll_bar.maximum() - scroll_bar.sliderPosition()
+        
+        end = self._history_start
+        self._history_start = self._page_start(session.messages, end)
+        cards = self._build_history_cards(session.messages[self._history_start:end])
+        for offset, card in enumerate(cards):
+            self.message_layout.insertWidget(1 + offset, card)
+        self._card_widgets[0:0] = cards
+        self._earlier_pages.append((end, len(cards)))
+        self.earlier_button.setVisible(self._history_start > 0)
+    
+    def release_earlier_history(self):
+        """
+        Drop the cards of earlier pages so only the latest page stays resident.
+        
+        The pages are rebuilt from the history manager if the user scrolls
+        back up to them.
+        """
+        if not self._earlier_pages:
+            return
+        
+        released = sum(count for _, count in self._earlier_pages)
+        self._history_start = self._earlier_pages[0][0]
+        self._earlier_pages.clear()
+        
+        self.message_container.setUpdatesEnabled(False)
+        try:
+            for widget in self._card_widgets[:released]:
+                self.message_layout.removeWidget(widget)
+                widget.deleteLater()
+        finally:
+            self.message_container.setUpdatesEnabled(True)
+        del self._card_widgets[:released]
+        self.earlier_button.setVisible(self._history_start > 0)
+    
+    @pyqtSlot(int, int)
+    def _on_scroll_range_changed(self, minimum, maximum):
+        """Keep the view at the bottom, or in place while earlier cards are prepended."""
+        if self._scroll_anchor is not None:
+            self.scroll_area.verticalScrollBar().setValue(maximum - self._scroll_anchor)
+        elif self._stick_to_bottom:
+            self.scroll_area.verticalScrollBar().setValue(maximum)
+    
+    @pyqtSlot(int)
+    def _on_scroll_action(self, action):
+        """Track whether the user left the bottom and page history in or out."""
+        self._scroll_anchor = None
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        self._stick_to_bottom = scroll_bar.sliderPosition() >= scroll_bar.maximum()
+        if self._stick_to_bottom:
+            self.release_earlier_history()
+        elif self._history_start > 0 and scroll_bar.sliderPosition() <= scroll_bar.minimum():
+            self.load_earlier_history()
+    
+    def _page_start(self, messages, end: int) -> int:
+        """
+        Find where the history page ending at ``end`` begins.
+        
+        Args:
+            messages: All messages of the session
+            end: Index one past the last message of the page
+            
+        Returns:
+            int: Index of the page's first message, moved back to the start
+            of a user turn so an AI card is never split across pages
+        """
+        start = max(0, end - self.HISTORY_PAGE_SIZE)
+        while start > 0 and messages[start].sender != "user":
+            start -= 1
+        return start
+    
+    def _build_history_cards(self, messages) -> List[QFrame]:
+        """Create the cards for a run of stored messages."""
+        cards = []
         current_ai_card = None
-        for msg in session.messages:
+        for msg in messages:
             if msg.sender == "user":
-                self._add_widget_to_display(UserMessageCard(msg.content, self.theme))
+                cards.append(UserMessageCard(msg.content))
                 current_ai_card = None
             else:
                 if current_ai_card is None:
-                    current_ai_card = self._add_widget_to_display(
-                        GroupedMessageCard(self.theme, self.bridge.config.model_name)
-                    )
+                    current_ai_card = GroupedMessageCard(self.bridge.config.model_name)
+                    cards.append(current_ai_card)
                 current_ai_card.add_message_part(
                     msg.sender, msg.content, msg.message_type == 'tool_call'
                 )
+        return cards
     
+    @pyqtSlot()
     def send_message(self):
         """Send a message to the AI."""
         prompt = self.text_input.toPlainText().strip()
-        if not prompt:
+        # Cmd+Return bypasses the disabled send button while a reply is pending
+        if not prompt or self._active_signals is not None:
             return
         
         # Add user message to history and display
         self.history_manager.add_message(self.session_id, "user", prompt)
-        self._add_widget_to_display(UserMessageCard(prompt, self.theme))
+        # Follow the new exchange, even if an earlier page was just prepended
+        self._scroll_anchor = None
+        self._stick_to_bottom = True
+        self._add_widget_to_display(UserMessageCard(prompt))
         
         # Clear input and disable send button
         self.text_input.clear()
@@ -890,28 +1293,87 @@ class ChatView(QWidget):
         worker.signals.tool_call.connect(self.on_tool_call)
         worker.signals.error.connect(self.on_error)
         worker.signals.finished.connect(self.on_finished)
+        self._active_signals = worker.signals
         self.threadpool.start(worker)
         
         self.current_ai_card = None
     
+    def set_bridge(self, bridge):
+        """Point the view at a new AI bridge without rebuilding it."""
+        self._detach_active_worker()
+        self.bridge = bridge
+    
+    def set_session_id(self, session_id):
+        """Switch the view to another chat session and redisplay its history."""
+        self._detach_active_worker()
+        self.session_id = session_id
+        self.current_ai_card = None
+        self.load_history()
+    
+    def set_file_cache(self, file_cache):
+        """Replace the files offered by the input's autocomplete."""
+        self.text_input.update_file_cache(file_cache)
+    
+    def _detach_active_worker(self):
+        """Stop listening to an in-flight request so it can't write into the next session."""
+        if self._active_signals is None:
+            return
+        for signal, slot in (
+            (self._active_signals.message, self.on_ai_message),
+            (self._active_signals.tool_call, self.on_tool_call),
+            (self._active_signals.error, self.on_error),
+            (self._active_signals.finished, self.on_finished),
+        ):
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass  # Already disconnected
+        self._active_signals = None
+        self.on_finished()
+    
     def _add_widget_to_display(self, widget):
-        """Add a widget to the message display."""
-        self.message_layout.insertWidget(self.message_layout.count() - 1, widget)
+        """
+        Queue a card for the message display.
+        
+        The card is returned straight away so parts can still be added to it;
+        it is inserted into the layout by the next _flush_pending_cards.
+        """
+        if not self._pending_cards:
+            QTimer.singleShot(0, self._flush_pending_cards)
+        self._pending_cards.append(widget)
+        self._card_widgets.append(widget)
         return widget
     
+    def _flush_pending_cards(self):
+        """Append all queued cards to the message layout in one relayout."""
+        if not self._pending_cards:
+            return
+        self.message_container.setUpdatesEnabled(False)
+        try:
+            for widget in self._pending_cards:
+                self.message_layout.addWidget(widget)
+        finally:
+            self._pending_cards.clear()
+            self.message_container.setUpdatesEnabled(True)
+    
     def clear_chat_display(self):
         """Clear all messages from the display."""
-        while self.message_layout.count() > 1:
-            item = self.message_layout.takeAt(0)
-            widget = item.widget() if item else None
-            if widget is not None:
-                widget.deleteLater()
+        for widget in self._card_widgets:
+            self.message_layout.removeWidget(widget)
+            widget.deleteLater()
+        self._card_widgets.clear()
+        self._pending_cards.clear()
+        self._history_start = 0
+        self._earlier_pages.clear()
+        self._scroll_anchor = None
+        self._stick_to_bottom = True
+        self.earlier_button.hide()
     
     def welcome_message(self):
         """Display a welcome message for new chats."""
         self.clear_chat_display()
         welcome_card = self._add_widget_to_display(
-            GroupedMessageCard(self.theme, self.bridge.config.model_name)
+            GroupedMessageCard(self.bridge.config.model_name)
         )
         welcome_card.add_message_part("Geode", "Welcome! How can I help with your vault?")
     
@@ -921,7 +1383,7 @@ class ChatView(QWidget):
         self.history_manager.add_message(self.session_id, "system", content, "tool_call")
         if self.current_ai_card is None:
             self.current_ai_card = self._add_widget_to_display(
-                GroupedMessageCard(self.theme, self.bridge.config.model_name)
+                GroupedMessageCard(self.bridge.config.model_name)
             )
         self.current_ai_card.add_message_part("Tool", content, is_tool_call=True)
     
@@ -931,7 +1393,7 @@ class ChatView(QWidget):
         self.history_manager.add_message(self.session_id, "assistant", content)
         if self.current_ai_card is None:
             self.current_ai_card = self._add_widget_to_display(
-                GroupedMessageCard(self.theme, self.bridge.config.model_name)
+                GroupedMessageCard(self.bridge.config.model_name)
             )
         self.current_ai_card.add_message_part(sender, content)
     
@@ -940,20 +1402,16 @@ class ChatView(QWidget):
         """Handle error display."""
         self.history_manager.add_message(self.session_id, "system", error_text, "error")
         error_card = self._add_widget_to_display(
-            GroupedMessageCard(self.theme, self.bridge.config.model_name)
+            GroupedMessageCard(self.bridge.config.model_name, object_name="errorCard")
         )
         error_card.add_message_part("Error", error_text)
-        error_card.setStyleSheet("""
-            QFrame {
-                border: 1px solid red;
-                background-color: #401010;
-                border-radius: 12px;
-            }
-        """)
     
     @pyqtSlot()
     def on_finished(self):
         """Handle completion of AI processing."""
+        self._active_signals = None
+        # Persist the finished turn in the background without waiting for the flush timer
+        self.history_manager.flush()
         self.send_button.setDisabled(False)
         self.send_button.setText("Send")
         self.current_ai_card = None
@@ -963,6 +1421,123 @@ class ChatView(QWidget):
 # NAVIGATION SIDEBAR
 # ============================================================================
 
+class SessionListModel(QAbstractListModel):
+    """Lightweight list model exposing chat sessions to the sidebar view."""
+    
+    # Rows are handed to the view in batches as it scrolls towards the end
+    FETCH_BATCH_SIZE = 20
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sessions = []
+        self._snapshot = []
+        self._rows_by_id = {}
+        self._fetched = 0
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of sessions fetched so far (flat list, so no children)."""
+        if parent.isValid():
+            return 0
+        return self._fetched
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        """Return True while some sessions have not been exposed to the view yet."""
+        return not parent.isValid() and self._fetched < len(self._sessions)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Expose the next batch of sessions to the view."""
+        if parent.isValid():
+            return
+        self._fetch_to(self._fetched + self.FETCH_BATCH_SIZE - 1)
+    
+    def _fetch_to(self, row: int):
+        """Expose every session up to and including ``row``."""
+        last = min(row, len(self._sessions) - 1)
+        if last < self._fetched:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, last)
+        self._fetched = last + 1
+        self.endInsertRows()
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the session title for display and its id for UserRole."""
+        if not index.isValid() or index.row() >= self._fetched:
+            return None
+        session = self._sessions[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return session.title
+        if role == Qt.ItemDataRole.UserRole:
+            return session.session_id
+        return None
+    
+    def update(self, sessions) -> bool:
+        """
+        Replace the listed sessions, resetting the view only on real changes.
+        
+        Args:
+            sessions: Sessions to display, in display order
+            
+        Returns:
+            bool: True if the model was reset
+        """
+        snapshot = [(s.session_id, s.title) for s in sessions]
+        if snapshot == self._snapshot:
+            self._sessions = list(sessions)
+            return False
+        
+        self.beginResetModel()
+        self._sessions = list(sessions)
+        self._snapshot = snapshot
+        self._rows_by_id = {session_id: row for row, (session_id, _) in enumerate(snapshot)}
+        self._fetched = min(len(snapshot), self.FETCH_BATCH_SIZE)
+        self.endResetModel()
+        return True
+    
+    def row_for_session(self, session_id: str) -> int:
+        """
+        Return the row of a session, fetching rows up to it if needed.
+        
+        Args:
+            session_id: The session to look up
+            
+        Returns:
+            int: The session's row, or -1 if it is not listed
+        """
+        row = self._rows_by_id.get(session_id, -1)
+        if row >= self._fetched:
+            self._fetch_to(row)
+        return row
+
+
+@functools.lru_cache(maxsize=None)
+def _glyph_icon(glyph: str, size: int) -> QIcon:
+    """
+    Rasterize a text glyph such as an emoji into an icon, once per glyph and size.
+    
+    Emoji in button text go through fallback-font shaping on every repaint;
+    an icon is a plain pixmap blit.
+    
+    Args:
+        glyph: The character sequence to draw
+        size: Icon edge length in logical pixels
+        
+    Returns:
+        QIcon: The cached icon
+    """
+    ratio = QApplication.instance().devicePixelRatio()
+    pixmap = QPixmap(int(size * ratio), int(size * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    font = painter.font()
+    font.setPixelSize(size)
+    painter.setFont(font)
+    painter.drawText(0, 0, size, size, Qt.AlignmentFlag.AlignCenter, glyph)
+    painter.end()
+    return QIcon(pixmap)
+
+
 class NavigationSidebar(QWidget):
     """Sidebar for navigation and chat session management."""
     
@@ -971,14 +1546,27 @@ class NavigationSidebar(QWidget):
     loadChat = pyqtSignal(str)
     deleteChat = pyqtSignal(str)
     
-    def __init__(self, theme, history_manager):
+    def __init__(self, theme, history_manager, qss=None, pane_qss=""):
         super().__init__()
         self.theme = theme
+        self.qss = qss if qss is not None else build_theme_qss(theme)
         self.history_manager = history_manager
-        self._setup_ui()
+        self._setup_ui(pane_qss)
     
-    def _setup_ui(self):
+    def set_pane_stylesheet(self, pane_qss: str = ""):
+        """
+        Style the sidebar with one stylesheet set on its root.
+        
+        Args:
+            pane_qss: Application overrides to layer under the sidebar's own rules
+        """
+        self.setStyleSheet(pane_qss + self.qss["sidebar"])
+    
+    def _setup_ui(self, pane_qss=""):
         """Set up the sidebar UI."""
+        # Children are styled by object name from a single sidebar stylesheet,
+        # set once here with the caller's overrides already layered in
+        self.set_pane_stylesheet(pane_qss)
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(12, 12, 12, 12)
         self.main_layout.setSpacing(10)
@@ -998,17 +1586,8 @@ class NavigationSidebar(QWidget):
     def _setup_new_chat_button(self):
         """Set up the new chat button."""
         self.new_chat_button = QPushButton("  +  New Chat")
+        self.new_chat_button.setObjectName("newChatButton")
         self.new_chat_button.setFixedHeight(44)
-        self.new_chat_button.setStyleSheet(f"""
-            background-color: {self.theme['tertiary_accent']};
-            color: #ffffff;
-            border: none;
-            border-radius: 10px;
-            text-align: left;
-            padding-left: 14px;
-            font-size: 14px;
-            font-weight: bold;
-        """)
         self.new_chat_button.clicked.connect(self.newChat.emit)
         self.main_layout.addWidget(self.new_chat_button)
     
@@ -1016,38 +1595,21 @@ class NavigationSidebar(QWidget):
         """Set up the recent chats list."""
         recents_label = QLabel("RECENTS")
         recents_label.setFixedHeight(20)
-        recents_label.setStyleSheet(f"""
-            color: {self.theme['text_secondary']};
-            font-size: 11px;
-            font-weight: bold;
-            padding-left: 8px;
-            border: none;
-        """)
+        recents_label.setIndent(8)
+        recents_label.setObjectName("recentsLabel")
         self.main_layout.addWidget(recents_label)
         
-        self.chat_list = QListWidget()
-        self.chat_list.setStyleSheet(f"""
-            QListWidget {{
-                border: none;
-                font-size: 13px;
-                padding: 0px;
-            }}
-            QListWidget::item {{
-                height: 36px;
-                padding-left: 10px;
-                border-radius: 6px;
-                margin: 2px 0px;
-            }}
-            QListWidget::item:hover {{
-                background-color: #475569;
-            }}
-            QListWidget::item:selected {{
-                background-color: {self.theme['background']};
-                color: {self.theme['text_primary']};
-            }}
-        """)
-        
-        self.chat_list.itemClicked.connect(self.on_chat_selected)
+        self._chat_model = SessionListModel(self)
+        self.chat_list = QListView()
+        self.chat_list.setObjectName("chatList")
+        self.chat_list.setModel(self._chat_model)
+        self.chat_list.setUniformItemSizes(True)
+        # Lay out long session lists in batches instead of all rows at once
+        self.chat_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.chat_list.setBatchSize(50)
+        self.chat_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        
+        self.chat_list.clicked.connect(self.on_chat_selected)
         self.chat_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.chat_list.customContextMenuRequested.connect(self.show_context_menu)
         self.main_layout.addWidget(self.chat_list)
@@ -1056,54 +1618,53 @@ class NavigationSidebar(QWidget):
     
     def _setup_profile_section(self):
         """Set up the profile/settings section."""
-        profile_frame = QFrame()
-        profile_layout = QHBoxLayout(profile_frame)
+        # A nested layout positions the button; no container widget needed
+        profile_layout = QHBoxLayout()
         profile_layout.setContentsMargins(5, 5, 5, 5)
         profile_layout.addStretch()
         
-        self.settings_button = QPushButton("⚙️")
+        self.settings_button = QPushButton()
+        self.settings_button.setObjectName("settingsButton")
+        self.settings_button.setIcon(_glyph_icon("⚙️", 18))
+        self.settings_button.setToolTip("Settings")
         self.settings_button.setFixedSize(32, 32)
-        self.settings_button.setStyleSheet("""
-            QPushButton {
-                border: none;
-                font-size: 18px;
-            }
-        """)
         self.settings_button.clicked.connect(self.openSettings.emit)
         profile_layout.addWidget(self.settings_button)
         
-        self.main_layout.addWidget(profile_frame)
+        self.main_layout.addLayout(profile_layout)
     
     def refresh_list(self, current_session_id=None):
-        """Refresh the chat list with recent sessions."""
-        self.chat_list.clear()
-        sessions = self.history_manager.get_recent_sessions()
-        selected_row = -1
-        
-        for idx, session in enumerate(sessions):
-            item = QListWidgetItem(session.title)
-            item.setData(Qt.ItemDataRole.UserRole, session.session_id)
-            self.chat_list.addItem(item)
-            
-            if current_session_id and session.session_id == current_session_id:
-                selected_row = idx
+        """Refresh the chat list with every session, newest first."""
+        # The model hands rows to the view in batches, so long histories stay cheap
+        sessions = self.history_manager.get_recent_sessions(limit=None)
         
-        # Ensure the current session is selected if present
-        if selected_row != -1:
-            self.chat_list.setCurrentRow(selected_row)
+        # Repopulate and reselect in one repaint
+        self.chat_list.setUpdatesEnabled(False)
+        try:
+            self._chat_model.update(sessions)
+            
+            # Ensure the current session is selected if present
+            if current_session_id:
+                selected_row = self._chat_model.row_for_session(current_session_id)
+                if selected_row != -1:
+                    self.chat_list.setCurrentIndex(self._chat_model.index(selected_row))
+        finally:
+            self.chat_list.setUpdatesEnabled(True)
     
-    def on_chat_selected(self, item):
+    @pyqtSlot(QModelIndex)
+    def on_chat_selected(self, index):
         """Handle chat selection."""
-        if item is None:
+        if index is None or not index.isValid():
             return
-        session_id = item.data(Qt.ItemDataRole.UserRole)
+        session_id = index.data(Qt.ItemDataRole.UserRole)
         if session_id:
             self.loadChat.emit(session_id)
     
+    @pyqtSlot(QPoint)
     def show_context_menu(self, position):
         """Show context menu for chat items."""
-        item = self.chat_list.itemAt(position)
-        if item is None:
+        index = self.chat_list.indexAt(position)
+        if not index.isValid():
             return
         
         menu = QMenu()
@@ -1111,7 +1672,7 @@ class NavigationSidebar(QWidget):
         action = menu.exec(self.chat_list.mapToGlobal(position))
         
         if action == delete_action:
-            session_id = item.data(Qt.ItemDataRole.UserRole)
+            session_id = index.data(Qt.ItemDataRole.UserRole)
             if session_id:
                 self.deleteChat.emit(session_id)
 
@@ -1120,164 +1681,262 @@ class NavigationSidebar(QWidget):
 # MAIN APPLICATION
 # ============================================================================
 
+# Custom Geode overrides applied on top of the qt-material base theme. They are
+# set on the smallest widgets that need them rather than on the application,
+# so restyling one pane never re-polishes the whole widget tree.
+_BUTTON_QSS_TEMPLATE = """
+    /* Primary buttons with custom purple */
+    QPushButton {
+        background-color: ${primary_accent};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-weight: 500;
+        font-size: 14px;
+    }
+    
+    QPushButton:hover {
+        background-color: #8B7CE8;
+    }
+    
+    QPushButton:pressed {
+        background-color: #7C6AE4;
+    }
+"""
+
+_INPUT_QSS_TEMPLATE = """
+    /* Input fields with Material Design styling */
+    QLineEdit, QTextEdit {
+        background-color: ${surface};
+        border: 2px solid transparent;
+        border-radius: 8px;
+        padding: 12px;
+        color: ${text_primary};
+        font-size: 14px;
+    }
+    
+    QLineEdit:focus, QTextEdit:focus {
+        border-color: ${primary_accent};
+    }
+"""
+
+_CARD_QSS_TEMPLATE = """
+    /* Chat message cards with Material Design elevation */
+    QFrame#aiCard {
+        background-color: ${surface};
+        border: none;
+        border-radius: 12px;
+    }
+
+    /* User messages sit on the window background, unlike AI cards */
+    QFrame#userCard {
+        background-color: transparent;
+    }
+    
+    /* Typography improvements */
+    QLabel#chatMessage {
+        color: ${text_primary};
+    }
+"""
+
+_LIST_QSS_TEMPLATE = """
+    /* List items with Material Design styling */
+    QListView::item {
+        background-color: transparent;
+        border: none;
+        border-radius: 8px;
+        padding: 12px;
+        margin: 2px 0px;
+        color: ${text_primary};
+    }
+    
+    QListView::item:hover {
+        background-color: rgba(169, 149, 242, 0.1);
+    }
+    
+    QListView::item:selected {
+        background-color: ${primary_accent};
+        color: white;
+    }
+"""
+
+_SIDEBAR_BASE_QSS_TEMPLATE = """
+    * {
+        background-color: ${surface};
+    }
+"""
+
+_GEODE_QSS_TEMPLATES = {
+    "sidebar": string.Template(_BUTTON_QSS_TEMPLATE + _LIST_QSS_TEMPLATE),
+    "chat": string.Template(_BUTTON_QSS_TEMPLATE + _INPUT_QSS_TEMPLATE + _CARD_QSS_TEMPLATE),
+    "dialog": string.Template(_BUTTON_QSS_TEMPLATE + _INPUT_QSS_TEMPLATE),
+}
+
+# Application theme - Updated with custom purple RGB(169, 149, 242)
+_THEME = {
+    "background": "#1a1a2e",        # Deep purple-navy
+    "surface": "#2d2d44",           # Purple-gray surface
+    "primary_accent": "#A995F2",    # Custom purple RGB(169, 149, 242)
+    "secondary_accent": "#2563eb",  # Blue secondary 
+    "tertiary_accent": "#f97316",   # Orange tertiary
+    "text_primary": "#f1f5f9",     # Light text
+    "text_secondary": "#a78bfa"     # Purple-tinted secondary text
+}
+
+# The theme never changes at runtime, so every stylesheet is rendered once at import
+_THEME_QSS = build_theme_qss(_THEME)
+_GEODE_QSS = {
+    name: template.substitute(_THEME)
+    for name, template in _GEODE_QSS_TEMPLATES.items()
+}
+_SIDEBAR_BASE_QSS = string.Template(_SIDEBAR_BASE_QSS_TEMPLATE).substitute(_THEME)
+_WINDOW_FALLBACK_QSS = f"""
+    background-color: {_THEME['background']};
+    color: {_THEME['text_primary']};
+"""
+
+
 class GeodeApp(QMainWindow):
     """Main application window."""
     
     fileCacheUpdated = pyqtSignal(list)
     
+    # The qt-material base stylesheet is application-wide; apply it only once
+    _material_applied = False
+    
     def __init__(self):
         super().__init__()
         
-        # Define application theme - Updated with custom purple RGB(169, 149, 242)
-        self.theme = {
-            "background": "#1a1a2e",        # Deep purple-navy
-            "surface": "#2d2d44",           # Purple-gray surface
-            "primary_accent": "#A995F2",    # Custom purple RGB(169, 149, 242)
-            "secondary_accent": "#2563eb",  # Blue secondary 
-            "tertiary_accent": "#f97316",   # Orange tertiary
-            "text_primary": "#f1f5f9",     # Light text
-            "text_secondary": "#a78bfa"     # Purple-tinted secondary text
-        }
+        self.theme = _THEME
+        self.theme_qss = _THEME_QSS
+        self._geode_qss = _GEODE_QSS
+        self._sidebar_base_qss = _SIDEBAR_BASE_QSS
         
         # Initialize application state
         self.bridge = None
         self.file_cache = []
         self.history_manager = None
         self.current_session_id = None
+        # Built in setup_main_widgets; None until then
+        self.sidebar_pane = None
+        self.main_content_pane = None
+        self._settings_dialog = None
+        
+        # File cache refreshes are debounced and served by one persistent thread
+        self._cache_refresh_timer = QTimer(self)
+        self._cache_refresh_timer.setSingleShot(True)
+        self._cache_refresh_timer.setInterval(150)
+        self._cache_refresh_timer.timeout.connect(self._do_update_file_cache)
+        # Unparented: a scan may outlive the window (see closeEvent)
+        self._cache_worker = FileCacheWorker()
+        self._cache_worker.signals.file_cache_updated.connect(self.on_cache_updated)
+        self._cache_worker.signals.error.connect(self.on_cache_error)
+        # One persistent connection that always targets the current chat view
+        self.fileCacheUpdated.connect(self._fanout_file_cache, Qt.ConnectionType.UniqueConnection)
         
         self._setup_window()
         self._apply_material_theme()
         self.load_and_init_ui()
     
+    def closeEvent(self, event):
+        """Flush pending chat history and stop background work before the window closes."""
+        if self.history_manager is not None:
+            self.history_manager.flush(blocking=True)
+        if self._cache_worker.isRunning():
+            self._cache_worker.stop()
+            # A scan in progress can take a request timeout per tree level;
+            # don't hold the window open for it. Keep the thread referenced
+            # until it finishes so it is never destroyed while running.
+            if not self._cache_worker.wait(2000):
+                logger.debug("File cache refresh still running at close; abandoning it")
+                worker = self._cache_worker
+                _abandoned_cache_workers.add(worker)
+                worker.finished.connect(lambda: _abandoned_cache_workers.discard(worker))
+        # Let in-flight background history writes finish before exiting
+        QThreadPool.globalInstance().waitForDone(2000)
+        super().closeEvent(event)
+    
     def _setup_window(self):
         """Set up the main window properties."""
         self.setWindowTitle("Geode - Obsidian & Gemini")
         self.setGeometry(100, 100, 1400, 900)
         self.setMinimumSize(1000, 700)
         # Basic fallback styling will be replaced by Material Design
-        self.setStyleSheet(f"""
-            background-color: {self.theme['background']};
-            color: {self.theme['text_primary']};
-        """)
+        self.setStyleSheet(_WINDOW_FALLBACK_QSS)
     
     def _apply_material_theme(self):
         """Apply Material Design theme to the application"""
-        if not QT_MATERIAL_AVAILABLE:
-            print("qt-material not available, using fallback theme")
+        if GeodeApp._material_applied:
             return
         
+        # Set GEODE_DISABLE_MATERIAL to skip loading and parsing the base theme
+        if os.getenv("GEODE_DISABLE_MATERIAL"):
+            logger.info("Material Design theme disabled, using fallback theme")
+            return
+        
+        # qt-material is optional and only imported when the theme is applied
         try:
-            # Apply dark purple as base theme
+            from qt_material import apply_stylesheet
+        except ImportError:
+            logger.info("qt-material not available, using fallback theme")
+            return
+        
+        try:
+            # Apply dark purple as base theme; Geode overrides are attached
+            # per pane via _pane_stylesheet
             apply_stylesheet(QApplication.instance(), theme='dark_purple.xml')
+            GeodeApp._material_applied = True
             
-            # Override with custom colors
-            custom_styles = f"""
-            /* Custom Geode Material Design Overrides */
-            
-            /* Primary buttons with custom purple */
-            QPushButton {{
-                background-color: {self.theme['primary_accent']};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-weight: 500;
-                font-size: 14px;
-            }}
-            
-            QPushButton:hover {{
-                background-color: #8B7CE8;
-            }}
-            
-            QPushButton:pressed {{
-                background-color: #7C6AE4;
-            }}
-            
-            /* Chat message cards with Material Design elevation */
-            QFrame {{
-                background-color: {self.theme['surface']};
-                border: none;
-                border-radius: 12px;
-            }}
-            
-            /* Input fields with Material Design styling */
-            QLineEdit, QTextEdit {{
-                background-color: {self.theme['surface']};
-                border: 2px solid transparent;
-                border-radius: 8px;
-                padding: 12px;
-                color: {self.theme['text_primary']};
-                font-size: 14px;
-            }}
-            
-            QLineEdit:focus, QTextEdit:focus {{
-                border-color: {self.theme['primary_accent']};
-            }}
-            
-            /* List items with Material Design styling */
-            QListWidget::item {{
-                background-color: transparent;
-                border: none;
-                border-radius: 8px;
-                padding: 12px;
-                margin: 2px 0px;
-                color: {self.theme['text_primary']};
-            }}
-            
-            QListWidget::item:hover {{
-                background-color: rgba(169, 149, 242, 0.1);
-            }}
-            
-            QListWidget::item:selected {{
-                background-color: {self.theme['primary_accent']};
-                color: white;
-            }}
-            
-            /* Typography improvements */
-            QLabel {{
-                color: {self.theme['text_primary']};
-            }}
-            
-            /* Sidebar styling */
-            QFrame[objectName="sidebar"] {{
-                background-color: {self.theme['surface']};
-            }}
-            """
-            
-            # Apply custom styles on top of Material Design base
-            current_stylesheet = QApplication.instance().styleSheet()
-            QApplication.instance().setStyleSheet(current_stylesheet + custom_styles)
-            
-            print("Material Design theme applied successfully")
+            logger.debug("Material Design theme applied successfully")
             
         except Exception as e:
-            print(f"Error applying Material Design theme: {e}")
+            logger.error("Error applying Material Design theme: %s", e)
+    
+    def _pane_stylesheet(self, pane: str) -> str:
+        """
+        Get the Geode override stylesheet for a pane.
+        
+        Args:
+            pane: One of "sidebar", "chat" or "dialog"
+            
+        Returns:
+            str: The pre-rendered overrides, or "" without the Material base
+        """
+        if not self._material_applied:
+            return ""
+        return self._geode_qss[pane]
     
     def load_and_init_ui(self):
         """Load configuration and initialize the UI."""
         try:
             self.config = Config.load()
-            self.history_manager = ChatHistoryManager(self.config.chat_history_file)
         except Exception as e:
-            QMessageBox.critical(
-                self, "Fatal Error", 
-                f"Could not load critical files.\\n\\nError: {e}"
-            )
-            sys.exit(1)
+            self._fatal_load_error(e)
         
         # Check if initial setup is needed
-        has_ai_key = (
-            self.config.gemini_api_key or self.config.claude_api_key or 
-            self.config.openai_api_key or self.config.cohere_api_key or 
-            self.config.mistral_api_key or self.config.perplexity_api_key or 
-            self.config.together_api_key or self.config.ai_provider == "ollama"
+        has_ai_key = self.config.ai_provider == "ollama" or any(
+            getattr(self.config, attr, None) for attr in _API_KEY_ATTRS
         )
-        if not has_ai_key or not self.config.obsidian_api_key:
+        if not has_ai_key or not bool(self.config.obsidian_api_key):
             if not self.show_settings_dialog(is_first_run=True):
                 sys.exit(0)
         
+        # Chat history is only needed once the main window is built
+        try:
+            self.history_manager = ChatHistoryManager(self.config.chat_history_file)
+        except Exception as e:
+            self._fatal_load_error(e)
+        
         self.setup_main_widgets()
-        self.load_latest_session()
+    
+    def _fatal_load_error(self, error: Exception):
+        """Report a failure to load critical files and exit."""
+        QMessageBox.critical(
+            self, "Fatal Error", 
+            f"Could not load critical files.\\n\\nError: {error}"
+        )
+        sys.exit(1)
     
     def setup_main_widgets(self):
         """Set up the main UI widgets."""
@@ -1293,25 +1952,33 @@ class GeodeApp(QMainWindow):
         main_layout.addWidget(splitter)
         
         # Sidebar
-        self.sidebar_pane = NavigationSidebar(self.theme, self.history_manager)
-        self.sidebar_pane.setStyleSheet(f"background-color: {self.theme['surface']};")
+        self.sidebar_pane = NavigationSidebar(
+            self.theme, self.history_manager, qss=self.theme_qss,
+            pane_qss=self._sidebar_base_qss + self._pane_stylesheet("sidebar")
+        )
         splitter.addWidget(self.sidebar_pane)
         
         # Main content area
         self.main_content_pane = QFrame()
         splitter.addWidget(self.main_content_pane)
         splitter.setSizes([350, 1050])
+        # Window resizes go to the chat; the sidebar keeps its width
+        splitter.setStretchFactor(0, 0)
+        splitter.setStretchFactor(1, 1)
         
         # Connect sidebar signals
         self.sidebar_pane.openSettings.connect(self.handle_settings_button_click)
         self.sidebar_pane.newChat.connect(self.reset_chat_session)
         self.sidebar_pane.loadChat.connect(self.load_chat_session)
         self.sidebar_pane.deleteChat.connect(self.delete_chat_session)
+        
+        # Let the event loop paint the empty window before loading the session
+        QTimer.singleShot(0, self.load_latest_session)
     
     def load_latest_session(self):
         """Load the most recent chat session or create a new one."""
         if not self.history_manager:
-            print("No history manager available in load_latest_session.")
+            logger.error("No history manager available in load_latest_session.")
             return
         
         recent_sessions = self.history_manager.get_recent_sessions(1)
@@ -1325,7 +1992,7 @@ class GeodeApp(QMainWindow):
         """Load a specific chat session."""
         self.current_session_id = session_id
         
-        if hasattr(self, 'sidebar_pane') and self.sidebar_pane is not None:
+        if self.sidebar_pane is not None:
             self.sidebar_pane.refresh_list(current_session_id=session_id)
         else:
             logger.warning("sidebar_pane is not available in load_chat_session.")
@@ -1339,16 +2006,25 @@ class GeodeApp(QMainWindow):
     
     def show_settings_dialog(self, is_first_run=False):
         """Show the settings configuration dialog."""
-        dialog = SettingsDialog(self.config, self)
+        # Build the dialog once; later opens only refresh its fields
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self.config, self)
+            self._settings_dialog.setStyleSheet(self._pane_stylesheet("dialog"))
+        else:
+            self._settings_dialog.reload_from(self.config)
+        dialog = self._settings_dialog
         if is_first_run:
             dialog.setWindowTitle("Initial Setup Required")
         
         if dialog.exec():
-            print("Settings saved. Refreshing AI bridge...")
-            self.refresh_bridge(new_chat_instance=True)
+            # On first run the main widgets do not exist yet; the bridge is
+            # created when the first session loads
+            if not is_first_run:
+                logger.info("Settings saved. Refreshing AI bridge...")
+                self.refresh_bridge(new_chat_instance=True)
             return True
         elif is_first_run:
-            print("Initial setup cancelled. Exiting.")
+            logger.info("Initial setup cancelled. Exiting.")
             sys.exit(0)
         
         return False
@@ -1389,7 +2065,7 @@ class GeodeApp(QMainWindow):
             
             self.history_manager.delete_session(session_id)
             
-            if hasattr(self, 'sidebar_pane') and self.sidebar_pane is not None:
+            if self.sidebar_pane is not None:
                 self.sidebar_pane.refresh_list()
             else:
                 logger.warning("sidebar_pane is not available in delete_chat_session.")
@@ -1404,35 +2080,47 @@ class GeodeApp(QMainWindow):
         """Refresh the AI bridge and chat view."""
         try:
             if new_chat_instance or self.bridge is None:
+                from geode_bridge.bridge import GeodeBridge
                 self.bridge = GeodeBridge(self.config)
             
-            # Disconnect previous connections to avoid duplicates
-            try:
-                if hasattr(self, '_last_text_input') and self._last_text_input is not None:
-                    self.fileCacheUpdated.disconnect(self._last_text_input.update_file_cache)
-            except Exception:
-                pass  # Ignore if not connected
+            # Reuse the existing chat view; only the bridge and session change
+            if isinstance(self.main_content_pane, ChatView):
+                chat_view = self.main_content_pane
+                chat_view.set_bridge(self.bridge)
+                chat_view.set_session_id(self.current_session_id)
+                chat_view.set_file_cache(self.file_cache)
+                self.update_file_cache()
+                logger.debug("AI Bridge refreshed successfully.")
+                return
             
-            # Create new chat view
+            # Create the chat view the first time through
             new_chat_view = ChatView(
                 self.theme, self.bridge, self.history_manager, 
-                self.file_cache, self.current_session_id
+                self.file_cache, self.current_session_id, self.theme_qss
             )
-            self.fileCacheUpdated.connect(new_chat_view.text_input.update_file_cache)
-            self._last_text_input = new_chat_view.text_input
+            new_chat_view.setStyleSheet(self._pane_stylesheet("chat"))
             
-            # Replace the main content pane
-            splitter = self.main_content_pane.parentWidget()
+            # Replace the placeholder content pane
+            splitter = self.main_content_pane.parentWidget() if self.main_content_pane is not None else None
             if isinstance(splitter, QSplitter):
-                old_widget = splitter.widget(1)
-                if old_widget and old_widget is not new_chat_view:
-                    old_widget.deleteLater()
-                splitter.insertWidget(1, new_chat_view)
-                splitter.setSizes([350, 1050])
+                # Suspend painting so the swap relayouts and repaints once
+                splitter.setUpdatesEnabled(False)
+                self.setUpdatesEnabled(False)
+                try:
+                    # replaceWidget hands the new view the old pane's geometry,
+                    # so the splitter keeps its sizes without another solve
+                    old_widget = splitter.replaceWidget(1, new_chat_view)
+                    if old_widget is not None:
+                        old_widget.deleteLater()
+                    # The stretch factor lives in the pane's size policy, so reapply it
+                    splitter.setStretchFactor(1, 1)
+                finally:
+                    splitter.setUpdatesEnabled(True)
+                    self.setUpdatesEnabled(True)
             
             self.main_content_pane = new_chat_view
             self.update_file_cache()
-            print("AI Bridge refreshed successfully.")
+            logger.debug("AI Bridge refreshed successfully.")
             
         except Exception as e:
             QMessageBox.critical(
@@ -1441,34 +2129,40 @@ class GeodeApp(QMainWindow):
             )
     
     def update_file_cache(self):
-        """Update the file cache in a background thread."""
+        """Schedule a file cache update, coalescing rapid repeated requests."""
+        self._cache_refresh_timer.start()
+    
+    @pyqtSlot()
+    def _do_update_file_cache(self):
+        """Hand a file cache update to the background cache thread."""
         if self.bridge is None:
-            print("Cannot update file cache: bridge is None.")
+            logger.debug("Cannot update file cache: bridge is None.")
             return
         
-        worker = FileCacheWorker(self.bridge)
-        worker.signals.file_cache_updated.connect(self.on_cache_updated)
-        worker.signals.error.connect(lambda msg: print(f"Cache Error: {msg}"))
-        
-        pool = QThreadPool.globalInstance()
-        if pool is not None:
-            pool.start(worker)
-        else:
-            print("QThreadPool.globalInstance() returned None!")
+        # At most one scan runs and one waits; newer requests replace the waiting one
+        self._cache_worker.request_refresh(self.bridge)
+        if not self._cache_worker.isRunning():
+            self._cache_worker.start()
     
     @pyqtSlot(list)
     def on_cache_updated(self, file_list):
         """Handle file cache update completion."""
         self.file_cache = file_list
-        
-        # Update file cache if main_content_pane is a ChatView and has text_input
-        text_input = getattr(self.main_content_pane, 'text_input', None)
-        if text_input is not None:
-            text_input.update_file_cache(self.file_cache)
+        self.fileCacheUpdated.emit(self.file_cache)
+        logger.debug("File cache updated in main app. Found %d items.", len(self.file_cache))
+    
+    @pyqtSlot(str)
+    def on_cache_error(self, message):
+        """Log a failed file cache refresh."""
+        logger.error("Cache Error: %s", message)
+    
+    @pyqtSlot(list)
+    def _fanout_file_cache(self, file_list):
+        """Forward file cache updates to whichever chat view is current."""
+        if isinstance(self.main_content_pane, ChatView):
+            self.main_content_pane.text_input.update_file_cache(file_list)
         else:
-            print("main_content_pane does not have text_input; skipping file cache update.")
-        
-        print(f"File cache updated in main app. Found {len(self.file_cache)} items.")
+            logger.debug("main_content_pane is not a ChatView; skipping file cache update.")
 
 
 # ============================================================================
@@ -1477,15 +2171,27 @@ class GeodeApp(QMainWindow):
 
 def ensure_config_exists():
     """Ensure a basic config file exists."""
-    if not Path("config.json").exists():
-        print("config.json not found. Creating a dummy file.")
-        with open("config.json", 'w') as f:
-            json.dump({"gemini_api_key": "", "obsidian_api_key": ""}, f, indent=2)
+    try:
+        os.stat("config.json")
+        return
+    except FileNotFoundError:
+        pass
+    
+    logger.warning("config.json not found. Creating a dummy file.")
+    # Write then rename so an interrupted start never leaves a truncated config
+    with open("config.json.tmp", 'w') as f:
+        json.dump({"gemini_api_key": "", "obsidian_api_key": ""}, f, indent=2)
+    os.replace("config.json.tmp", "config.json")
 
 
 if __name__ == "__main__":
+    # Status messages go through logging; INFO keeps them visible, DEBUG stays quiet
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     ensure_config_exists()
     app = QApplication(sys.argv)
+    # The UI is styled by style sheets, which Fusion fully supports unlike native
+    # styles such as windows11; set it before any widget exists so none is re-polished
+    app.setStyle("Fusion")
     main_window = GeodeApp()
     main_window.show()
     sys.exit(app.exec())
\ No newline at end of file
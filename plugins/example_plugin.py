@@ -30,10 +30,11 @@ class ExamplePlugin:
             if not text:
                 return "No text provided"
             
+            # str.count walks the text without building throwaway copies or lists
             words = len(text.split())
             chars = len(text)
-            chars_no_spaces = len(text.replace(' ', ''))
-            lines = len(text.split('\n'))
+            chars_no_spaces = chars - text.count(' ')
+            lines = text.count('\n') + 1
             
             return f"Text statistics:\n- Words: {words}\n- Characters: {chars}\n- Characters (no spaces): {chars_no_spaces}\n- Lines: {lines}"
         except Exception as e:
@@ -5,12 +5,50 @@ Setup script for Obsidian Geode migration to google-genai SDK
 
 import subprocess
 import sys
-import os
+
+def find_missing_requirements(path="requirements.txt"):
+    """Return the requirements that are not installed at a matching version, or None if unknown"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        from packaging.requirements import InvalidRequirement, Requirement
+    except ImportError:
+        return None
+    
+    missing = []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            # pip options (-r, -e, --index-url) and URLs are left to pip itself
+            try:
+                req = Requirement(line)
+            except InvalidRequirement:
+                return None
+            if req.marker and not req.marker.evaluate():
+                continue
+            try:
+                if not req.specifier.contains(version(req.name), prereleases=True):
+                    missing.append(line)
+            except PackageNotFoundError:
+                missing.append(line)
+    return missing
 
 def install_requirements():
     """Install required packages from requirements.txt"""
+    # Skip spawning pip entirely when everything is already installed
+    missing = find_missing_requirements()
+    if missing == []:
+        print("✅ All requirements already satisfied")
+        return True
+    
+    if missing is None:
+        command = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
+    else:
+        command = [sys.executable, "-m", "pip", "install", *missing]
+    
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        subprocess.check_call(command)
         print("✅ Successfully installed requirements")
         return True
     except subprocess.CalledProcessError as e: